@@ -3,11 +3,13 @@ from __future__ import annotations
 import argparse
 import curses
 import json
+import pickle
 import random
 import sys
 import textwrap
 import time
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 try:
@@ -29,6 +31,13 @@ RUST_SNIPPETS_FILE = SNIPPETS_DIR / "rust_snippets.txt"
 TS_SNIPPETS_FILE = SNIPPETS_DIR / "typescript_snippets.txt"
 QUOTES_FILE = SNIPPETS_DIR / "quotes.txt"
 
+# Performance note: the hot paths here are string handling and curses I/O,
+# which JIT compilers such as Numba do not help with — their string support
+# is minimal and the import/compile overhead alone would exceed this app's
+# entire runtime.  Keep hot loops on CPython's C-level builtins instead:
+# str.translate/str.maketrans for any character normalization,
+# operator.itemgetter for bulk indexing, and "".join over pre-sized lists.
+
 
 @dataclass(frozen=True)
 class WordPack:
@@ -39,6 +48,21 @@ class WordPack:
     quotes: tuple[str, ...] = ()    # full sentences for quote mode
     quote_authors: tuple[str, ...] = ()  # parallel to quotes: author names
 
+    @cached_property
+    def blob(self) -> str:
+        """All words joined into one contiguous buffer for cheap slicing."""
+        return "\n".join(self.words)
+
+    @cached_property
+    def offsets(self) -> tuple[int, ...]:
+        """Start offsets into blob; blob[offsets[i]:offsets[i+1]-1] is word i."""
+        offs = [0]
+        pos = 0
+        for word in self.words:
+            pos += len(word) + 1
+            offs.append(pos)
+        return tuple(offs)
+
 
 @dataclass(frozen=True)
 class CodeLine:
@@ -53,11 +77,22 @@ class TestStats:
     total_keystrokes: int = 0
 
 
+@lru_cache(maxsize=1)
 def _load_english_words() -> tuple[str, ...]:
     if not ENGLISH_WORDS_FILE.exists():
         raise FileNotFoundError(
             "Missing 1000-most-common-words.txt next to main.py"
         )
+    # Parsed word list is cached as a pickled tuple next to the source file so
+    # subsequent launches skip the per-line parse entirely.
+    cache = ENGLISH_WORDS_FILE.with_suffix(".pkl")
+    try:
+        if cache.exists() and cache.stat().st_mtime >= ENGLISH_WORDS_FILE.stat().st_mtime:
+            cached = pickle.loads(cache.read_bytes())
+            if cached:
+                return cached
+    except (pickle.UnpicklingError, EOFError, OSError):
+        pass  # stale or unreadable cache: fall through and re-parse
     words: list[str] = []
     for line in ENGLISH_WORDS_FILE.read_text(encoding="utf-8").splitlines():
         cleaned = line.strip()
@@ -65,7 +100,12 @@ def _load_english_words() -> tuple[str, ...]:
             words.append(cleaned)
     if not words:
         raise ValueError("English word list file is empty")
-    return tuple(words)
+    result = tuple(words)
+    try:
+        cache.write_bytes(pickle.dumps(result, protocol=5))
+    except OSError:
+        pass  # read-only install location: just skip the cache
+    return result
 
 
 def _load_snippets(path: Path) -> tuple[str, ...]:
@@ -132,6 +172,7 @@ def _filter_by_difficulty(
     return filtered if filtered else words
 
 
+@lru_cache(maxsize=1)
 def _build_word_packs() -> dict[str, WordPack]:
     packs: dict[str, WordPack] = {
         "python": WordPack(
@@ -389,6 +430,12 @@ def _load_custom_words(path: str) -> WordPack:
     )
 
 
+@lru_cache(maxsize=1)
+def _sorted_pack_keys() -> tuple[str, ...]:
+    """Pack names in display order, sorted once per process."""
+    return tuple(sorted(_build_word_packs()))
+
+
 def _build_parser(word_packs: dict[str, WordPack]) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="koalatype",
@@ -418,7 +465,7 @@ def _build_parser(word_packs: dict[str, WordPack]) -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--pack", default=None,
-        choices=sorted(word_packs.keys()),
+        choices=_sorted_pack_keys(),
         help="Word pack to use (default: english-1000).",
     )
     parser.add_argument(
@@ -452,7 +499,7 @@ def _build_parser(word_packs: dict[str, WordPack]) -> argparse.ArgumentParser:
 
 def _render_pack_list(word_packs: dict[str, WordPack]) -> str:
     lines = ["Available word packs:"]
-    for key in sorted(word_packs.keys()):
+    for key in _sorted_pack_keys():
         pack = word_packs[key]
         lines.append(f"  {pack.name:<15s} {pack.description}")
     return "\n".join(lines)
@@ -461,7 +508,9 @@ def _render_pack_list(word_packs: dict[str, WordPack]) -> str:
 def _generate_prompt(pack: WordPack, count: int, seed: int | None) -> str:
     if count <= 0:
         raise ValueError("word count must be positive")
-    rng = random.Random(seed)
+    # Unseeded runs use the module-level generator directly; a fresh Random
+    # instance is only needed when the caller wants a repeatable test.
+    rng = random.Random(seed) if seed is not None else random
     if pack.snippets:
         available = list(pack.snippets)
         rng.shuffle(available)
@@ -484,7 +533,10 @@ def _generate_prompt(pack: WordPack, count: int, seed: int | None) -> str:
             if total_words >= count:
                 break
         return " ".join(selected_q)
-    return " ".join(rng.choices(pack.words, k=count))
+    blob = pack.blob
+    offsets = pack.offsets
+    idx = rng.choices(range(len(pack.words)), k=count)
+    return " ".join(blob[offsets[i]: offsets[i + 1] - 1] for i in idx)
 
 
 def _generate_quote_attributions(
@@ -512,13 +564,12 @@ def _generate_quote_attributions(
 
 
 def _score(
-    prompt: str, typed: str, elapsed_seconds: float, stats: TestStats
+    prompt_words: list[str], typed: str, elapsed_seconds: float, stats: TestStats
 ) -> dict[str, float]:
-    prompt_words = prompt.split()
     typed_words = typed.split()
 
     correct = sum(
-        1 for expected, actual in zip(prompt_words, typed_words) if expected == actual
+        expected == actual for expected, actual in zip(prompt_words, typed_words)
     )
     total = max(len(prompt_words), 1)
     accuracy = correct / total
@@ -539,38 +590,36 @@ def _score(
 
 def _layout_prompt(prompt: str, width: int) -> tuple[list[str], list[tuple[int, int]]]:
     lines: list[str] = []
-    positions: list[tuple[int, int]] = []
+    n = len(prompt)
+    # exactly one position per prompt character, preallocated up front and
+    # written in place instead of grown append by append
+    positions: list[tuple[int, int]] = [(0, 0)] * n
     row = 0
-    col = 0
-    current_line: list[str] = []
+    start = 0
+    pi = 0
 
-    words = prompt.split(" ")
-
-    for word_idx, word in enumerate(words):
-        word_len = len(word)
-        space_len = 1 if col > 0 else 0
-
-        if col > 0 and col + space_len + word_len > width:
-            lines.append("".join(current_line))
-            current_line = []
-            row += 1
-            col = 0
-            positions.append((row, col))
-
-        if col > 0:
-            current_line.append(" ")
-            positions.append((row, col))
-            col += 1
-
-        for ch in word:
-            current_line.append(ch)
-            positions.append((row, col))
-            col += 1
-
-    if current_line or not lines:
-        lines.append("".join(current_line))
-
-    return lines, positions
+    # Greedy wrap using C-level string searches: each line is a slice of the
+    # prompt ending at the last space that fits, and the consumed space maps
+    # to the start of the following row.  A single word longer than the width
+    # stays whole on its own line, matching the old per-character walk.
+    while True:
+        if n - start <= width:
+            line = prompt[start:]
+        else:
+            cut = prompt.rfind(" ", start, start + width + 1)
+            if cut == -1:
+                cut = prompt.find(" ", start)
+            line = prompt[start:] if cut == -1 else prompt[start:cut]
+        lines.append(line)
+        end = pi + len(line)
+        positions[pi:end] = [(row, col) for col in range(len(line))]
+        pi = end
+        start += len(line) + 1
+        if start > n:
+            return lines, positions
+        row += 1
+        positions[pi] = (row, 0)  # the consumed separator space
+        pi += 1
 
 
 def _build_rendered_text(
@@ -894,81 +943,159 @@ def _run_curses_test(
         stdscr.keypad(True)
         _init_colors()
 
-        typed_words: list[list[str]] = [[]]
+        # colour pairs and key constants resolved once, outside the key loop
+        green = curses.color_pair(1)
+        red = curses.color_pair(2)
+        cyan = curses.color_pair(3)
+        yellow = curses.color_pair(4)
+        key_resize = curses.KEY_RESIZE
+        backspace_keys = _BACKSPACE_KEYS
+
+        # Typed input lives in one contiguous UTF-8 buffer: word_starts holds
+        # the byte offset where each typed word begins and cur_len counts the
+        # characters of the word in progress.  Appending a key is a byte write
+        # instead of growing a per-word list of one-character strings.
+        typed_buf = bytearray()
+        word_starts: list[int] = [0]
         word_index = 0
+        cur_len = 0
+
+        def _typed_word(i: int) -> str:
+            lo = word_starts[i]
+            hi = word_starts[i + 1] if i + 1 < len(word_starts) else len(typed_buf)
+            return typed_buf[lo:hi].decode("utf-8")
+
         start_time: float | None = None
-        stdscr.nodelay(True)
+        # Block in get_wch for up to 100 ms instead of polling with nodelay:
+        # keys are delivered immediately, and an idle loop wakes just often
+        # enough to tick the timer rather than spinning at 100 redraws/sec.
+        stdscr.timeout(100)
+
+        base_row = 5 if quote_attributions else 4
+
+        # Rendered-text geometry.  Base start offsets never change; overflow
+        # padding per word (extra) is maintained as keys arrive, so relayout
+        # just re-applies the padding instead of re-walking typed_words.
+        base_starts: list[int] = []
+        offset = 0
+        for word in prompt_words:
+            base_starts.append(offset)
+            offset += len(word) + 1
+        extra = [0] * len(prompt_words)
+
+        # Layout state.  Recomputed only when the wrap can actually change:
+        # on resize, or when a typed word overflows (or stops overflowing)
+        # its prompt word and shifts the rendered padding.  Steady-state
+        # keystrokes touch a single cell instead of repainting the screen.
+        layout_dirty = True
+        rendered_text = ""
+        prompt_starts: list[int] = []
+        prompt_lines: list[str] = []
+        positions: list[tuple[int, int]] = []
+        width = 0
+        usable_width = 20
+        max_lines = 0
+        last_decisec = -1
+        progress_dirty = True
+        layout_sig: tuple[int, tuple[int, ...]] | None = None
 
         while True:
-            stdscr.erase()
-            height, width = stdscr.getmaxyx()
-            usable_width = max(20, width - 2)
-            rendered_text, prompt_starts = _build_rendered_text(
-                prompt_words, typed_words
-            )
-            prompt_lines, positions = _layout_prompt(rendered_text, usable_width)
-
             now = time.perf_counter()
             elapsed = (now - start_time) if start_time else 0.0
 
-            title = "koalatype"
-            stdscr.addstr(0, 0, title[: width - 1], curses.color_pair(3))
-
-            if zen_mode:
-                header = f"Zen mode -- {elapsed:.1f}s" if start_time else "Zen mode -- start typing, press Esc when done"
-            else:
-                remaining = max(duration_seconds - elapsed, 0.0)
-                header = f"Time left: {remaining:4.1f}s"
-            stdscr.addstr(1, 0, header[: width - 1], curses.color_pair(3))
-
-            words_done = sum(
-                1 for i in range(min(word_index, len(prompt_words)))
-                if i < len(typed_words) and "".join(typed_words[i]) == prompt_words[i]
-            )
-            pbar = _progress_bar(words_done, len(prompt_words), usable_width)
-            stdscr.addstr(2, 0, pbar[: width - 1], curses.color_pair(4))
+            if layout_dirty:
+                stdscr.erase()
+                height, width = stdscr.getmaxyx()
+                usable_width = max(20, width - 2)
+                # the wrap only depends on the width and the overflow padding;
+                # skip the recompute when neither changed (e.g. vertical resize)
+                sig = (usable_width, tuple(extra))
+                if sig != layout_sig:
+                    layout_sig = sig
+                    rendered_text = " ".join(
+                        w + " " * e for w, e in zip(prompt_words, extra)
+                    )
+                    prompt_starts = []
+                    delta = 0
+                    for w_idx, start in enumerate(base_starts):
+                        prompt_starts.append(start + delta)
+                        delta += extra[w_idx]
+                    prompt_lines, positions = _layout_prompt(
+                        rendered_text, usable_width
+                    )
+                max_lines = max(0, height - base_row - 2)
 
-            if quote_attributions:
-                current_author = ""
-                for start_word, author in reversed(quote_attributions):
-                    if word_index >= start_word:
-                        current_author = author
-                        break
-                if current_author:
-                    attr_str = f"\u2014 {current_author}"
-                    stdscr.addstr(3, 0, attr_str[: width - 1], curses.A_DIM)
+                title = "koalatype"
+                stdscr.addstr(0, 0, title[: width - 1], cyan)
 
-            base_row = 5 if quote_attributions else 4
-            max_lines = max(0, height - base_row - 2)
-            for idx, line in enumerate(prompt_lines[:max_lines]):
-                stdscr.addstr(base_row + idx, 0, line)
+                for idx, line in enumerate(prompt_lines[:max_lines]):
+                    stdscr.addstr(base_row + idx, 0, line)
 
-            for w_idx, typed_word in enumerate(typed_words):
-                if w_idx >= len(prompt_words):
-                    break
-                expected_word = prompt_words[w_idx]
-                word_start = prompt_starts[w_idx]
+                # repaint every previously-typed character
+                for w_idx in range(min(len(word_starts), len(prompt_words))):
+                    typed_word = _typed_word(w_idx)
+                    expected_word = prompt_words[w_idx]
+                    word_start = prompt_starts[w_idx]
 
-                for i, ch in enumerate(typed_word):
-                    char_index = word_start + i
-                    if char_index >= len(positions):
-                        break
-                    row, col = positions[char_index]
-                    if row >= max_lines:
-                        continue
-                    expected_char = (
-                        expected_word[i] if i < len(expected_word) else None
-                    )
-                    color = (
-                        curses.color_pair(1)
-                        if expected_char is not None and ch == expected_char
-                        else curses.color_pair(2)
-                    )
-                    stdscr.addstr(base_row + row, col, ch, color)
+                    for i, ch in enumerate(typed_word):
+                        char_index = word_start + i
+                        if char_index >= len(positions):
+                            break
+                        row, col = positions[char_index]
+                        if row >= max_lines:
+                            continue
+                        expected_char = (
+                            expected_word[i] if i < len(expected_word) else None
+                        )
+                        color = (
+                            green
+                            if expected_char is not None and ch == expected_char
+                            else red
+                        )
+                        stdscr.addstr(base_row + row, col, ch, color)
+
+                layout_dirty = False
+                last_decisec = -1
+                progress_dirty = True
+
+            remaining = max(duration_seconds - elapsed, 0.0)
+            decisec = int((elapsed if zen_mode else remaining) * 10)
+            if decisec != last_decisec:
+                last_decisec = decisec
+                if zen_mode:
+                    header = f"Zen mode -- {elapsed:.1f}s" if start_time else "Zen mode -- start typing, press Esc when done"
+                else:
+                    header = f"Time left: {remaining:4.1f}s"
+                stdscr.move(1, 0)
+                stdscr.clrtoeol()
+                stdscr.addstr(1, 0, header[: width - 1], cyan)
+
+            if progress_dirty:
+                progress_dirty = False
+                words_done = sum(
+                    1 for i in range(min(word_index, len(prompt_words)))
+                    if _typed_word(i) == prompt_words[i]
+                )
+                pbar = _progress_bar(words_done, len(prompt_words), usable_width)
+                stdscr.move(2, 0)
+                stdscr.clrtoeol()
+                stdscr.addstr(2, 0, pbar[: width - 1], yellow)
+
+                if quote_attributions:
+                    current_author = ""
+                    for start_word, author in reversed(quote_attributions):
+                        if word_index >= start_word:
+                            current_author = author
+                            break
+                    stdscr.move(3, 0)
+                    stdscr.clrtoeol()
+                    if current_author:
+                        attr_str = f"\u2014 {current_author}"
+                        stdscr.addstr(3, 0, attr_str[: width - 1], curses.A_DIM)
 
             if word_index < len(prompt_words) and positions:
                 cursor_base = prompt_starts[word_index]
-                cursor_offset = len(typed_words[word_index])
+                cursor_offset = cur_len
                 cursor_index = min(
                     cursor_base + cursor_offset, len(positions) - 1
                 )
@@ -978,51 +1105,70 @@ def _run_curses_test(
 
             stdscr.refresh()
 
-            if not zen_mode and start_time is not None:
-                remaining = max(duration_seconds - elapsed, 0.0)
-                if remaining <= 0:
-                    break
+            if not zen_mode and start_time is not None and remaining <= 0:
+                break
 
             try:
                 key = stdscr.get_wch()
             except curses.error:
-                time.sleep(0.01)
-                continue
+                continue  # timeout: wake just to tick the timer
 
-            if start_time is None and key != curses.KEY_RESIZE:
+            if start_time is None and key != key_resize:
                 start_time = time.perf_counter()
 
             if key == "\x1b":
                 break
 
-            if key in _BACKSPACE_KEYS:
+            if key in backspace_keys:
                 stats.backspace_count += 1
                 stats.total_keystrokes += 1
-                if typed_words[word_index]:
-                    typed_words[word_index].pop()
+                if cur_len > 0:
+                    if cur_len > len(prompt_words[word_index]):
+                        # shrinking an overflowed word changes the wrap
+                        layout_dirty = True
+                    # pop one character: walk back over UTF-8 continuation bytes
+                    i = len(typed_buf) - 1
+                    while i > word_starts[word_index] and 0x80 <= typed_buf[i] < 0xC0:
+                        i -= 1
+                    del typed_buf[i:]
+                    cur_len -= 1
+                    if layout_dirty:
+                        extra[word_index] = cur_len - len(prompt_words[word_index])
+                    else:
+                        # restore the prompt character at the vacated cell
+                        char_index = prompt_starts[word_index] + cur_len
+                        if char_index < len(positions):
+                            row, col = positions[char_index]
+                            if row < max_lines:
+                                stdscr.addstr(
+                                    base_row + row, col, rendered_text[char_index]
+                                )
                 elif word_index > 0:
                     word_index -= 1
-                    typed_words.pop()
+                    word_starts.pop()
+                    cur_len = len(_typed_word(word_index))
+                    progress_dirty = True
                 continue
-            if key == curses.KEY_RESIZE:
+            if key == key_resize:
+                layout_dirty = True
                 continue
             if key == " ":
                 stats.total_keystrokes += 1
                 if word_index == len(prompt_words) - 1:
-                    typed_word_str = "".join(typed_words[word_index])
+                    typed_word_str = _typed_word(word_index)
                     expected_word = prompt_words[word_index]
                     if typed_word_str == expected_word:
                         break
 
                 if word_index < len(prompt_words) - 1:
                     word_index += 1
-                    if len(typed_words) <= word_index:
-                        typed_words.append([])
+                    word_starts.append(len(typed_buf))
+                    cur_len = 0
+                    progress_dirty = True
                 continue
             if isinstance(key, str) and key.isprintable():
                 stats.total_keystrokes += 1
-                current_word = typed_words[word_index]
-                char_pos = len(current_word)
+                char_pos = cur_len
                 if word_index < len(prompt_words):
                     expected_word = prompt_words[word_index]
                     if char_pos < len(expected_word):
@@ -1031,14 +1177,35 @@ def _run_curses_test(
                             stats.char_misses[expected_char] = (
                                 stats.char_misses.get(expected_char, 0) + 1
                             )
-                typed_words[word_index].append(key)
+                typed_buf.extend(key.encode("utf-8"))
+                cur_len += 1
+                if word_index >= len(prompt_words) or char_pos >= len(
+                    prompt_words[word_index]
+                ):
+                    # word overflowed: its padding shifts the whole wrap
+                    if word_index < len(prompt_words):
+                        extra[word_index] = cur_len - len(prompt_words[word_index])
+                    layout_dirty = True
+                else:
+                    char_index = prompt_starts[word_index] + char_pos
+                    if char_index < len(positions):
+                        row, col = positions[char_index]
+                        if row < max_lines:
+                            color = (
+                                green
+                                if key == prompt_words[word_index][char_pos]
+                                else red
+                            )
+                            stdscr.addstr(base_row + row, col, key, color)
 
         actual_elapsed = (
             (time.perf_counter() - start_time) if start_time is not None else 0.0
         )
         if not zen_mode:
             actual_elapsed = min(actual_elapsed, duration_seconds)
-        result["typed"] = " ".join("".join(word) for word in typed_words)
+        result["typed"] = " ".join(
+            _typed_word(i) for i in range(len(word_starts))
+        )
         result["elapsed"] = actual_elapsed
 
     curses.wrapper(_curses_main)
@@ -1280,6 +1447,10 @@ def _render_results(
     return "\n".join(lines)
 
 
+_REPEAT_PROMPT = "\nEnter 'r' to repeat, 'n' for new test, or 'q'/Esc to quit: "
+_REPEAT_CHOICES = frozenset(("r", "n", "q", "\x1b"))
+
+
 def _run_test_loop(
     pack: WordPack, word_count: int, duration: float, zen: bool, seed: int | None
 ) -> None:
@@ -1303,7 +1474,11 @@ def _run_test_loop(
                 quote_attributions=attributions,
             )
 
-        results = _score(prompt, typed, elapsed, test_stats)
+        # Whitespace split, not the curses loop's single-space split: code-mode
+        # prompts contain newlines, so scoring splits the prompt itself once
+        # per test rather than reusing the UI's word list.
+        prompt_words = prompt.split()
+        results = _score(prompt_words, typed, elapsed, test_stats)
         print(_render_results(results, test_stats, pack.name))
 
         _save_history({
@@ -1317,18 +1492,15 @@ def _run_test_loop(
         })
 
         while True:
-            choice = input(
-                "\nEnter 'r' to repeat, 'n' for new test, or 'q'/Esc to quit: "
-            ).strip()
-            if choice in ("q", "Q", "\x1b"):
+            choice = input(_REPEAT_PROMPT).strip().lower()
+            if choice not in _REPEAT_CHOICES:
+                print("Invalid choice. Please enter 'r', 'n', or 'q'.")
+                continue
+            if choice in ("q", "\x1b"):
                 return
-            elif choice.lower() == "r":
-                break
-            elif choice.lower() == "n":
+            if choice == "n":
                 seed = None
-                break
-            else:
-                print("Invalid choice. Please enter 'r', 'n', or 'q'.")
+            break
 
 
 def main() -> None: